@@ -1,55 +1,96 @@
-import math
-import random
+import time
+
+# Time the whole run, including the pandas/NumPy/Faker imports
+start = time.perf_counter()
+
+import argparse
+import os
+from pathlib import Path
 import pandas as pd
 import numpy as np
 from faker import Faker
 
-num_of_purchases = np.random.randint(20, 60)
+parser = argparse.ArgumentParser(
+    description="Generate a tab separated csv file of fake purchases.")
+parser.add_argument("--num", type=int,
+                    help="number of purchases (default: random, 20 to 59)")
+parser.add_argument("--verbose", action="store_true",
+                    help="print every generated purchase")
+args = parser.parse_args()
+if args.num is not None and args.num < 1:
+    parser.error("--num must be at least 1")
+
+# Set SEED to regenerate the same purchases
+seed = os.environ.get("SEED") or None
+if seed is not None:
+    try:
+        seed = int(seed)
+    except ValueError:
+        parser.error("SEED must be an integer")
+    if seed < 0:
+        parser.error("SEED must be a non-negative integer")
+    Faker.seed(seed)
+rng = np.random.default_rng(seed)
+fake_sentence = Faker().sentence
+
+sample_data_dir = Path(__file__).resolve().parent.parent / "sample_data"
+
+num_of_purchases = args.num
+if num_of_purchases is None:
+    num_of_purchases = rng.integers(20, 60)
 
 print(
     f"Generating a tab separated csv file with {num_of_purchases} purchases...")
 
-items = ['Gift', 'Student Loans', 'Entertainment', 'Education', 'Unknown',
+items = ('Gift', 'Student Loans', 'Entertainment', 'Education', 'Unknown',
          'Vacation', 'Bills', 'Organization', 'Pets', 'Groceries',
          'Public Transit', 'Hobbies', 'Fashion', 'Parking',
-         'Charity', 'Restaurant', 'Gasoline', 'Parking', 'Career',
-         'Banking fees']
+         'Charity', 'Restaurant', 'Gasoline', 'Career',
+         'Banking fees')
 
-fake_items = pd.Series([random.choice(items) for _ in range(num_of_purchases)])
+fake_items = pd.Categorical.from_codes(
+    rng.integers(0, len(items), size=num_of_purchases, dtype=np.int8),
+    categories=items)
 
-vendors = ['NSLSC', 'Ticketmaster', 'Amazon', 'Canadian Tire',
+vendors = ('NSLSC', 'Ticketmaster', 'Amazon', 'Canadian Tire',
            'Telus', 'Rens Pets', 'Sobeys', 'Presto',
            'Rex Beauty Inc (BSW)', 'City of Toronto',
            'TPL Foundation', 'Walmart', 'Shoppers Drug Mart',
            'Freshco', 'Daily Bread',
            'CNIB', 'CanadaHelps', 'Petro',
            'Sick Kids foundation', 'H&M', 'Toronto Humane',
-           'Real Canadian Super Store (RCSS)', 'Food Basics', 'Sport Check',
-           'Loblaws', 'ABC PLANE FEE (SCAM)', 'Tahinis',
-           'Bar Burrito', 'Ikea', 'Dollarama', 'Spotify',
+           'Real Canadian Super Store (RCSS)', 'Food Basics',
+           'Sport Check', 'Loblaws', 'ABC PLANE FEE (SCAM)',
+           'Tahinis', 'Bar Burrito', 'Ikea', 'Dollarama', 'Spotify',
            'Paramount Fine Foods', 'Chick-Fil-A',
-           'Chatime', 'Thai Express', 'The Alley', 'Cinnabon', 'Tim Hortons',
-           'Scotiabank', 'Longos', 'Patties',
-           'Dollar Tree']
+           'Chatime', 'Thai Express', 'The Alley', 'Cinnabon',
+           'Tim Hortons', 'Scotiabank', 'Longos', 'Patties',
+           'Dollar Tree')
 
-fake_vendors = pd.Series([random.choice(vendors)
-                         for _ in range(num_of_purchases)])
+fake_vendors = pd.Categorical.from_codes(
+    rng.integers(0, len(vendors), size=num_of_purchases, dtype=np.int8),
+    categories=vendors)
 
-# Fake notes
-fake = Faker()
-fake_notes = pd.Series([random.choice(['', '', fake.sentence(nb_words=5)])
-                       for _ in range(num_of_purchases)])
+# Fake notes, a third of the purchases get a sentence
+has_note = rng.integers(0, 3, size=num_of_purchases) == 2
+fake_notes = np.full(num_of_purchases, '', dtype=object)
+fake_notes[has_note] = [fake_sentence(nb_words=5)
+                        for _ in range(has_note.sum())]
 
 # Fake prices
-fake_prices = pd.Series(
-    [math.fabs(np.random.rand())*40 for _ in range(num_of_purchases)])
+fake_prices = rng.random(num_of_purchases, dtype=np.float32) * np.float32(40)
 
 # Fake dates
-fake_dates = pd.Series(np.random.randint(1, 31, size=(num_of_purchases)))
+fake_dates = rng.integers(1, 31, size=num_of_purchases, dtype=np.int8)
 
 purchases = pd.DataFrame({'Item': fake_items, 'Vendor': fake_vendors,
-                         'Price': fake_prices, 'Date': fake_dates, 'Notes': fake_notes})
+                          'Price': fake_prices, 'Date': fake_dates,
+                          'Notes': fake_notes}, copy=False)
 print(f"Final result...")
-print(purchases)
-purchases.to_csv(
-    f"sample_data/{num_of_purchases}-purchases.csv", sep="\t", index=False)
+print(purchases if args.verbose else purchases.head())
+sample_data_dir.mkdir(exist_ok=True)
+out_path = sample_data_dir / f"{num_of_purchases}-purchases.csv"
+with open(out_path, "w", buffering=1 << 20, newline="") as f:
+    purchases.to_csv(f, sep="\t", index=False)
+print(f"Wrote {len(purchases)} purchases to {out_path} "
+      f"in {time.perf_counter() - start:.2f}s")
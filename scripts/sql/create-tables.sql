@@ -12,7 +12,7 @@ CREATE TABLE users (
 
 CREATE TABLE categories (
 	category_id uuid DEFAULT gen_random_uuid(),
-	category_name varchar NOT NULL,
+	category_name varchar NOT NULL UNIQUE,
 	PRIMARY KEY(category_id)
 );
 
@@ -33,6 +33,9 @@ CREATE TABLE expenses (
 				ON DELETE CASCADE
 );
 
+-- newest-first listing of a user's expenses
+CREATE INDEX ix_expenses_user_date ON expenses (user_id, date_purchased DESC, expense_id DESC) INCLUDE (item, price);
+
 CREATE TABLE expense_categories (
 	expense_id uuid NOT NULL,
         category_id uuid NOT NULL,
@@ -47,6 +50,9 @@ CREATE TABLE expense_categories (
 				ON DELETE CASCADE
 );
 
+-- category -> expenses lookups (the primary key leads with expense_id)
+CREATE INDEX ix_expense_categories_category_expense ON expense_categories (category_id, expense_id);
+
 CREATE TABLE wishlist (
 	wish_id uuid DEFAULT gen_random_uuid(),
 	user_id uuid NOT NULL,
@@ -57,7 +63,7 @@ CREATE TABLE wishlist (
 	status char(20) NOT NULL, -- wished, scheduled, bought
 	notes varchar,
 	planned_date date,
-	created_at timestamp,
+	created_at timestamp NOT NULL,
         PRIMARY KEY (wish_id, user_id),
         CONSTRAINT fk_user
                 FOREIGN KEY(user_id)
@@ -65,6 +71,9 @@ CREATE TABLE wishlist (
 				ON DELETE CASCADE
 );
 
+-- newest-first listing of a user's wishlist
+CREATE INDEX ix_wishlist_user_created ON wishlist (user_id, created_at DESC, wish_id DESC);
+
 CREATE TABLE budgets (
 	budget_id uuid DEFAULT gen_random_uuid(),
 	user_id uuid NOT NULL,
@@ -85,3 +94,6 @@ CREATE TABLE budgets (
                         REFERENCES categories(category_id)
 				ON DELETE CASCADE
 );
+
+-- listing of a user's budgets, most recent period first
+CREATE INDEX ix_budgets_user_start ON budgets (user_id, start_date DESC, budget_id DESC);